@@ -0,0 +1,119 @@
+//! Columnar results for batch validation
+//!
+//! A batch result keeps each field of [`ValidatedEmail`] as its own column
+//! instead of one struct per address. String columns are a single arena
+//! plus end offsets, so 100k results are a handful of allocations and a
+//! whole column can be handed out without touching the others.
+
+use crate::error::EmailError;
+use crate::validator::{ValidateFn, ValidatedEmail};
+
+/// One string per row, stored back to back in a single buffer
+#[derive(Debug, Clone, Default)]
+pub struct StrColumn {
+    data: String,
+    ends: Vec<usize>,
+}
+
+impl StrColumn {
+    fn with_capacity(rows: usize, bytes: usize) -> Self {
+        Self {
+            data: String::with_capacity(bytes),
+            ends: Vec::with_capacity(rows),
+        }
+    }
+
+    #[inline]
+    fn push(&mut self, s: &str) {
+        self.data.push_str(s);
+        self.ends.push(self.data.len());
+    }
+
+    pub fn len(&self) -> usize {
+        self.ends.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.ends.is_empty()
+    }
+
+    /// The string in row `i`
+    #[inline]
+    pub fn get(&self, i: usize) -> &str {
+        let start = if i == 0 { 0 } else { self.ends[i - 1] };
+        &self.data[start..self.ends[i]]
+    }
+
+    pub fn iter(&self) -> impl ExactSizeIterator<Item = &str> + '_ {
+        (0..self.len()).map(|i| self.get(i))
+    }
+}
+
+/// Struct-of-arrays form of a list of validation results
+///
+/// Row `i` describes `emails[i]`. Rows for invalid addresses have
+/// `valid[i] == false` and empty strings in every string column.
+#[derive(Debug, Clone, Default)]
+pub struct ValidatedBatch {
+    pub valid: Vec<bool>,
+    pub original: StrColumn,
+    pub local_part: StrColumn,
+    pub domain: StrColumn,
+    pub normalized: StrColumn,
+    pub ascii_domain: StrColumn,
+    pub smtputf8: Vec<bool>,
+}
+
+impl ValidatedBatch {
+    /// Validate every address with `validate` and collect the results
+    pub fn validate<S: AsRef<str>>(emails: &[S], validate: ValidateFn) -> Self {
+        let rows = emails.len();
+        let bytes = emails.iter().map(|e| e.as_ref().len()).sum();
+        // Only the whole-address columns get up to the input size up front;
+        // the part columns are smaller and grow as needed
+        let mut batch = Self {
+            valid: Vec::with_capacity(rows),
+            original: StrColumn::with_capacity(rows, bytes),
+            local_part: StrColumn::with_capacity(rows, 0),
+            domain: StrColumn::with_capacity(rows, 0),
+            normalized: StrColumn::with_capacity(rows, bytes),
+            ascii_domain: StrColumn::with_capacity(rows, 0),
+            smtputf8: Vec::with_capacity(rows),
+        };
+        for email in emails {
+            batch.push(validate(email.as_ref()));
+        }
+        batch
+    }
+
+    fn push(&mut self, result: Result<ValidatedEmail, EmailError>) {
+        let v = result.as_ref().ok();
+        self.valid.push(v.is_some());
+        self.original.push(v.map_or("", |v| &v.original));
+        self.local_part.push(v.map_or("", |v| &v.local_part));
+        self.domain.push(v.map_or("", |v| &v.domain));
+        self.normalized.push(v.map_or("", |v| &v.normalized));
+        self.ascii_domain.push(v.map_or("", |v| &v.ascii_domain));
+        self.smtputf8.push(v.is_some_and(|v| v.smtputf8));
+    }
+
+    pub fn len(&self) -> usize {
+        self.valid.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.valid.is_empty()
+    }
+
+    /// Row `i` as a [`ValidatedEmail`], or `None` if that address is invalid
+    pub fn get(&self, i: usize) -> Option<ValidatedEmail> {
+        self.valid[i].then(|| ValidatedEmail {
+            original: self.original.get(i).to_string(),
+            local_part: self.local_part.get(i).to_string(),
+            domain: self.domain.get(i).to_string(),
+            normalized: self.normalized.get(i).to_string(),
+            ascii_domain: self.ascii_domain.get(i).to_string(),
+            smtputf8: self.smtputf8[i],
+        })
+    }
+}
@@ -0,0 +1,48 @@
+//! Bounded caches for values reused across calls
+
+use std::collections::HashMap;
+use std::sync::{Mutex, OnceLock};
+
+/// Thread-safe, string-keyed cache with a fixed capacity
+///
+/// When full, the cache is cleared instead of evicting single entries.
+/// Hot keys are re-inserted on their next use, so every operation stays a
+/// single hash probe with no recency bookkeeping.
+pub struct BoundedCache<V> {
+    map: OnceLock<Mutex<HashMap<Box<str>, V>>>,
+    capacity: usize,
+}
+
+impl<V> BoundedCache<V> {
+    pub const fn new(capacity: usize) -> Self {
+        Self {
+            map: OnceLock::new(),
+            capacity,
+        }
+    }
+
+    #[inline]
+    fn map(&self) -> &Mutex<HashMap<Box<str>, V>> {
+        self.map
+            .get_or_init(|| Mutex::new(HashMap::with_capacity(self.capacity)))
+    }
+
+    /// Look up `key` and map the cached value with `f` while the lock is held
+    #[inline]
+    pub fn get_with<R>(&self, key: &str, f: impl FnOnce(&V) -> R) -> Option<R> {
+        let map = self.map().lock().ok()?;
+        map.get(key).map(f)
+    }
+
+    /// Insert `value` under `key`, clearing the cache first if it is full
+    #[inline]
+    pub fn insert(&self, key: &str, value: V) {
+        // A poisoned lock only means the cache is skipped
+        if let Ok(mut map) = self.map().lock() {
+            if map.len() >= self.capacity && !map.contains_key(key) {
+                map.clear();
+            }
+            map.insert(key.into(), value);
+        }
+    }
+}
@@ -1,8 +1,14 @@
 //! Domain validation with IDNA 2008 support
 
+use crate::cache::BoundedCache;
 use crate::error::EmailError;
 use idna::domain_to_ascii;
 
+/// IDNA results for recently seen non-ASCII or Punycode domains, keyed by
+/// the raw domain. Real workloads repeat a small set of domains, so most
+/// lookups skip UTS-46 mapping and Punycode entirely.
+static IDNA_CACHE: BoundedCache<Result<String, EmailError>> = BoundedCache::new(4096);
+
 #[inline]
 pub fn validate_domain(domain: &str) -> Result<String, EmailError> {
     if domain.is_empty() {
@@ -19,8 +25,13 @@ pub fn validate_domain(domain: &str) -> Result<String, EmailError> {
         return Err(EmailError::DomainTooLong);
     }
 
-    // Convert to ASCII (handles IDN)
-    let ascii_domain = domain_to_ascii(domain).map_err(|_| EmailError::InvalidDomain)?;
+    // Convert to ASCII (handles IDN). Plain ASCII domains skip UTS-46
+    // processing, which only lowercases them.
+    let ascii_domain = if is_plain_ascii_domain(domain) {
+        domain.to_ascii_lowercase()
+    } else {
+        idna_to_ascii(domain)?
+    };
 
     // Require at least one dot (python-email-validator compatibility)
     if !ascii_domain.contains('.') {
@@ -45,6 +56,29 @@ pub fn validate_domain(domain: &str) -> Result<String, EmailError> {
     Ok(ascii_domain)
 }
 
+/// idna::domain_to_ascii behind IDNA_CACHE
+#[inline]
+fn idna_to_ascii(domain: &str) -> Result<String, EmailError> {
+    if let Some(cached) = IDNA_CACHE.get_with(domain, Clone::clone) {
+        return cached;
+    }
+    let result = domain_to_ascii(domain).map_err(|_| EmailError::InvalidDomain);
+    IDNA_CACHE.insert(domain, result.clone());
+    result
+}
+
+/// True for domains of letters, digits, hyphens and dots with no Punycode
+/// (`xn--`) labels, for which IDNA mapping is plain ASCII lowercasing
+#[inline]
+fn is_plain_ascii_domain(domain: &str) -> bool {
+    domain
+        .bytes()
+        .all(|b| b.is_ascii_alphanumeric() || b == b'-' || b == b'.')
+        && !domain
+            .split('.')
+            .any(|label| label.len() >= 4 && label[..4].eq_ignore_ascii_case("xn--"))
+}
+
 #[inline]
 fn validate_domain_label(label: &str) -> Result<(), EmailError> {
     if label.is_empty() {
@@ -1,4 +1,10 @@
 //! Zero-copy email validation - no heap allocations
+//!
+//! Grammar: `local@domain`, where the local part is dot-separated runs of
+//! RFC 5322 atext, and the domain is at least two dot-separated labels of
+//! letters, digits and inner hyphens.
+
+use crate::simd::ByteClassifier;
 
 /// Zero-copy email validator
 /// Validates without creating intermediate strings
@@ -15,26 +21,24 @@ impl ZeroCopyValidator {
             return false;
         }
 
+        // Vectorized pre-pass rejects most malformed input before the state machine
+        if ByteClassifier::fast_reject(bytes) {
+            return false;
+        }
+
         let mut state = ParseState::LocalStart;
-        let mut at_count = 0;
         let mut dot_count = 0;
 
         for &b in bytes.iter() {
             state = match state {
-                ParseState::LocalStart => {
-                    if b == b'.' {
+                ParseState::LocalStart | ParseState::LocalDot => {
+                    if !Self::is_local_char(b) {
                         return false;
                     }
-                    at_count += (b == b'@') as usize;
                     ParseState::Local
                 }
                 ParseState::Local => {
                     if b == b'@' {
-                        at_count += 1;
-                        if at_count > 1 {
-                            return false;
-                        }
-                        dot_count = 0;
                         ParseState::DomainStart
                     } else if b == b'.' {
                         ParseState::LocalDot
@@ -44,46 +48,37 @@ impl ZeroCopyValidator {
                         return false;
                     }
                 }
-                ParseState::LocalDot => {
-                    if b == b'.' || b == b'@' {
+                ParseState::DomainStart | ParseState::DomainDot => {
+                    if !b.is_ascii_alphanumeric() {
                         return false;
                     }
-                    at_count += (b == b'@') as usize;
-                    ParseState::Local
-                }
-                ParseState::DomainStart => {
-                    if b == b'.' || b == b'-' {
-                        return false;
-                    }
-                    if b == b'@' {
-                        return false;
-                    }
-                    dot_count += (b == b'.') as usize;
                     ParseState::Domain
                 }
                 ParseState::Domain => {
-                    if b == b'@' {
-                        return false;
-                    }
                     if b == b'.' {
                         dot_count += 1;
                         ParseState::DomainDot
-                    } else if Self::is_domain_char(b) {
+                    } else if b == b'-' {
+                        ParseState::DomainHyphen
+                    } else if b.is_ascii_alphanumeric() {
                         ParseState::Domain
                     } else {
                         return false;
                     }
                 }
-                ParseState::DomainDot => {
-                    if b == b'.' || b == b'-' || b == b'@' {
+                ParseState::DomainHyphen => {
+                    if b == b'-' {
+                        ParseState::DomainHyphen
+                    } else if b.is_ascii_alphanumeric() {
+                        ParseState::Domain
+                    } else {
                         return false;
                     }
-                    ParseState::Domain
                 }
             };
         }
 
-        matches!(state, ParseState::Domain) && at_count == 1 && dot_count >= 1
+        matches!(state, ParseState::Domain) && dot_count >= 1
     }
 
     #[inline(always)]
@@ -94,11 +89,6 @@ impl ZeroCopyValidator {
             b'=' | b'?' | b'^' | b'_' | b'`' | b'{' | b'|' | b'}' | b'~'
         )
     }
-
-    #[inline(always)]
-    const fn is_domain_char(b: u8) -> bool {
-        matches!(b, b'a'..=b'z' | b'A'..=b'Z' | b'0'..=b'9' | b'-')
-    }
 }
 
 #[derive(Clone, Copy)]
@@ -108,5 +98,6 @@ enum ParseState {
     LocalDot,
     DomainStart,
     Domain,
+    DomainHyphen,
     DomainDot,
 }
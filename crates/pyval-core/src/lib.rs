@@ -3,6 +3,8 @@
 //! This crate provides the core email validation logic
 //! that can be used by any language wrapper.
 
+pub mod batch;
+pub mod cache;
 pub mod domain;
 pub mod error;
 pub mod fastpath;
@@ -159,3 +159,137 @@ impl PortableSimd {
         Some(true)
     }
 }
+
+/// Bytes that may appear anywhere in an address on the ASCII fast path:
+/// RFC 5322 atext plus '.' and '@'
+#[cfg(target_arch = "x86_64")]
+#[inline(always)]
+const fn is_address_byte(b: u8) -> bool {
+    matches!(b,
+        b'a'..=b'z' | b'A'..=b'Z' | b'0'..=b'9' |
+        b'!' | b'#' | b'$' | b'%' | b'&' | b'\'' | b'*' | b'+' | b'-' | b'/' |
+        b'=' | b'?' | b'^' | b'_' | b'`' | b'{' | b'|' | b'}' | b'~' | b'.' | b'@'
+    )
+}
+
+/// Low-nibble lookup table: bit `hi - 2` is set when `(hi << 4) | lo` is an address byte
+#[cfg(target_arch = "x86_64")]
+static LOW_NIBBLE_TABLE: [u8; 16] = {
+    let mut table = [0u8; 16];
+    let mut lo = 0;
+    while lo < 16 {
+        let mut hi = 2;
+        while hi < 8 {
+            if is_address_byte(((hi << 4) | lo) as u8) {
+                table[lo] |= 1 << (hi - 2);
+            }
+            hi += 1;
+        }
+        lo += 1;
+    }
+    table
+};
+
+/// High-nibble lookup table: one bit per printable ASCII row, zero for
+/// control characters and non-ASCII bytes
+#[cfg(target_arch = "x86_64")]
+static HIGH_NIBBLE_TABLE: [u8; 16] = {
+    let mut table = [0u8; 16];
+    let mut hi = 2;
+    while hi < 8 {
+        table[hi] = 1 << (hi - 2);
+        hi += 1;
+    }
+    table
+};
+
+/// Vectorized byte classification for rejecting obviously invalid input
+///
+/// Each byte is classified with two 16-entry nibble tables whose AND is
+/// non-zero only for address bytes (the "universal lookup" trick), so a
+/// whole 32-byte block is checked with two shuffles.
+pub struct ByteClassifier;
+
+impl ByteClassifier {
+    /// Returns true if the input can never be a valid ASCII address:
+    /// not exactly one '@', a leading or trailing dot, or a byte outside
+    /// atext/'.'/'@'. Inputs that pass still need full validation.
+    ///
+    /// Only inputs of at least one 32-byte block are checked, and only on
+    /// CPUs with AVX2; for anything else a scalar pass costs about as much
+    /// as the parse itself, so this returns false without looking.
+    #[inline]
+    pub fn fast_reject(bytes: &[u8]) -> bool {
+        #[cfg(target_arch = "x86_64")]
+        {
+            if bytes.len() >= 32
+                && is_x86_feature_detected!("avx2")
+                && is_x86_feature_detected!("popcnt")
+            {
+                if bytes[0] == b'.' || bytes[bytes.len() - 1] == b'.' {
+                    return true;
+                }
+                // SAFETY: the required CPU features were detected at runtime
+                let (bytes_ok, at_count) = unsafe { Self::scan_avx2(bytes) };
+                return !bytes_ok || at_count != 1;
+            }
+        }
+        #[cfg(not(target_arch = "x86_64"))]
+        let _ = bytes;
+        false
+    }
+
+    /// Returns (every byte is an address byte, number of '@' signs)
+    #[cfg(target_arch = "x86_64")]
+    #[inline(always)]
+    fn scan_scalar(bytes: &[u8]) -> (bool, u32) {
+        let mut at_count = 0;
+        for &b in bytes {
+            let class =
+                LOW_NIBBLE_TABLE[(b & 0x0f) as usize] & HIGH_NIBBLE_TABLE[(b >> 4) as usize];
+            if class == 0 {
+                return (false, at_count);
+            }
+            at_count += (b == b'@') as u32;
+        }
+        (true, at_count)
+    }
+
+    #[cfg(target_arch = "x86_64")]
+    #[target_feature(enable = "avx2,popcnt")]
+    unsafe fn scan_avx2(bytes: &[u8]) -> (bool, u32) {
+        use std::arch::x86_64::*;
+
+        let low_table = _mm256_broadcastsi128_si256(_mm_loadu_si128(
+            LOW_NIBBLE_TABLE.as_ptr() as *const __m128i
+        ));
+        let high_table = _mm256_broadcastsi128_si256(_mm_loadu_si128(
+            HIGH_NIBBLE_TABLE.as_ptr() as *const __m128i
+        ));
+        let nibble_mask = _mm256_set1_epi8(0x0f);
+        let at_sign = _mm256_set1_epi8(b'@' as i8);
+        let zero = _mm256_setzero_si256();
+
+        let mut invalid = zero;
+        let mut at_count = 0u32;
+        let mut i = 0;
+        while i + 32 <= bytes.len() {
+            let v = _mm256_loadu_si256(bytes.as_ptr().add(i) as *const __m256i);
+            let lo = _mm256_and_si256(v, nibble_mask);
+            let hi = _mm256_and_si256(_mm256_srli_epi16(v, 4), nibble_mask);
+            let class = _mm256_and_si256(
+                _mm256_shuffle_epi8(low_table, lo),
+                _mm256_shuffle_epi8(high_table, hi),
+            );
+            invalid = _mm256_or_si256(invalid, _mm256_cmpeq_epi8(class, zero));
+            at_count += (_mm256_movemask_epi8(_mm256_cmpeq_epi8(v, at_sign)) as u32).count_ones();
+            i += 32;
+        }
+
+        if _mm256_movemask_epi8(invalid) != 0 {
+            return (false, at_count);
+        }
+        let (tail_ok, tail_at_count) = Self::scan_scalar(&bytes[i..]);
+        (tail_ok, at_count + tail_at_count)
+    }
+}
@@ -15,6 +15,9 @@ pub struct ValidatedEmail {
     pub smtputf8: bool,
 }
 
+/// A validation routine with its policy fixed at compile time
+pub type ValidateFn = fn(&str) -> Result<ValidatedEmail, EmailError>;
+
 #[derive(Debug, Clone, Default)]
 pub struct EmailValidator {
     pub allow_smtputf8: bool,
@@ -62,6 +65,26 @@ impl EmailValidator {
 
     #[inline]
     pub fn validate(&self, email: &str) -> Result<ValidatedEmail, EmailError> {
+        self.specialized()(email)
+    }
+
+    /// The validation routine for this validator's options
+    ///
+    /// Callers that validate many addresses with one validator can hold on
+    /// to the returned function so no option is tested per call.
+    /// `allow_smtputf8` is the only option that changes the outcome today.
+    pub fn specialized(&self) -> ValidateFn {
+        if self.allow_smtputf8 {
+            Self::validate_specialized::<true>
+        } else {
+            Self::validate_specialized::<false>
+        }
+    }
+
+    /// Validate with the options given as const parameters
+    pub fn validate_specialized<const ALLOW_SMTPUTF8: bool>(
+        email: &str,
+    ) -> Result<ValidatedEmail, EmailError> {
         // Fast trim using bytes
         let email = email.trim();
 
@@ -91,12 +114,16 @@ impl EmailValidator {
         let local_part = &email[..at_pos];
         let domain = &email[at_pos + 1..];
 
-        // Validate parts
-        validate_local_part(local_part, self.allow_smtputf8)?;
+        // Most addresses are pure ASCII; decide once and skip the Unicode work
+        let local_ascii = local_part.is_ascii();
+
+        // Validate parts. For ASCII input allow_smtputf8 cannot change the
+        // outcome, so passing false skips the non-ASCII scan.
+        validate_local_part(local_part, ALLOW_SMTPUTF8 && !local_ascii)?;
         let ascii_domain = validate_domain(domain)?;
 
         // Normalize - only NFC if needed
-        let normalized_local: String = if local_part.is_ascii() {
+        let normalized_local: String = if local_ascii {
             local_part.to_string()
         } else {
             local_part.nfc().collect()
@@ -109,7 +136,7 @@ impl EmailValidator {
         );
 
         // Check if SMTPUTF8 is required
-        let smtputf8 = !local_part.is_ascii();
+        let smtputf8 = !local_ascii;
 
         Ok(ValidatedEmail {
             original: email.to_string(),
@@ -13,22 +13,50 @@ Example:
     'user.name@example.com'
 """
 
-from .emailval import (
-    is_valid,
-    is_valid_ultra,
-    batch_is_valid,
-    validate_email,
-    EmailValidator,
-    ValidatedEmail,
-    __version__,
-)
+try:
+    from .emailval import (
+        is_valid,
+        is_valid_ultra,
+        batch_is_valid,
+        batch_is_valid_packed,
+        batch_validate,
+        validate_email,
+        validate_email_view,
+        EmailValidator,
+        ValidatedEmail,
+        ValidatedEmailView,
+        ValidatedBatch,
+        __version__,
+    )
+except ImportError:
+    # Native extension not built: keep the boolean checks usable through
+    # the pure-Python fallback; the rest of the API raises ImportError.
+    from ._fallback import (
+        is_valid,
+        is_valid_ultra,
+        batch_is_valid,
+        batch_is_valid_packed,
+    )
+
+    def __getattr__(name: str) -> object:
+        if name in __all__:
+            raise ImportError(
+                f"emailval.{name} requires the native extension. "
+                "Run: maturin develop --release"
+            )
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "is_valid",
     "is_valid_ultra",
     "batch_is_valid",
+    "batch_is_valid_packed",
+    "batch_validate",
     "validate_email",
+    "validate_email_view",
     "EmailValidator",
     "ValidatedEmail",
+    "ValidatedEmailView",
+    "ValidatedBatch",
     "__version__",
 ]
@@ -0,0 +1,165 @@
+"""
+Pure-Python fallback for the boolean checks.
+
+Used only when the native extension is not built (e.g. a source checkout
+without ``maturin develop``). Each function follows the same rules as its
+native counterpart, so results do not depend on whether the extension is
+built. Internationalized domains are converted with the ``idna`` package
+when it is installed and the stdlib codec otherwise, so unusual IDNs may
+still be judged differently from the native UTS-46 conversion. Full
+validation (``validate_email``, ``EmailValidator``) needs the native
+extension.
+"""
+
+import re
+from typing import List, Optional, Union
+
+try:
+    import idna as _idna
+except ImportError:
+    _idna = None
+
+# What Rust's str::trim strips (Unicode White_Space); str.strip() with no
+# argument would also strip \x1c-\x1f
+_WHITESPACE = (
+    "\t\n\x0b\x0c\r \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005"
+    "\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+# One domain label: letters and digits with inner hyphens
+_LABEL = re.compile(rb"[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?")
+
+# The grammar of the native zero-copy parser (lazy.rs) behind is_valid_ultra
+_ATEXT = rb"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+"
+_ULTRA_LABEL = rb"[A-Za-z0-9]+(?:-+[A-Za-z0-9]+)*"
+_ULTRA = re.compile(
+    _ATEXT + rb"(?:\." + _ATEXT + rb")*@" + _ULTRA_LABEL + rb"(?:\." + _ULTRA_LABEL + rb")+"
+)
+
+
+def _is_local_byte(c: int) -> bool:
+    # RFC 5322 atext
+    return (
+        0x61 <= c <= 0x7A or 0x41 <= c <= 0x5A or 0x30 <= c <= 0x39
+        or c == 0x21 or 0x23 <= c <= 0x27 or c == 0x2A or c == 0x2B
+        or c == 0x2D or c == 0x2F or c == 0x3D or c == 0x3F
+        or 0x5E <= c <= 0x60 or 0x7B <= c <= 0x7E
+    )
+
+
+def _is_valid_local(b: bytes, allow_high: bool) -> bool:
+    # Atext (and non-ASCII bytes if allowed) with single, inner dots
+    prev_dot = True
+    for i in range(len(b)):
+        c = b[i]
+        if c == 0x2E:
+            if prev_dot:
+                return False
+            prev_dot = True
+        elif _is_local_byte(c) or (allow_high and c >= 0x80):
+            prev_dot = False
+        else:
+            return False
+    return not prev_dot
+
+
+def _is_valid_labels(labels: List[bytes]) -> bool:
+    # At least two labels, not all numeric, each a well-formed label
+    return (
+        len(labels) > 1
+        and not all(not label or label.isdigit() for label in labels)
+        and all(len(label) <= 63 and _LABEL.fullmatch(label) for label in labels)
+    )
+
+
+def _is_valid_idn(domain: str) -> bool:
+    # IP literals reach here only with non-ASCII content, which never parses
+    if domain.startswith("[") and domain.endswith("]"):
+        return False
+    try:
+        if _idna is not None:
+            ascii_domain = _idna.encode(domain, uts46=True)
+        else:
+            ascii_domain = domain.encode("idna")
+    except UnicodeError:
+        return False
+    return _is_valid_labels(ascii_domain.split(b"."))
+
+
+def _is_valid_detailed(email: str, allow_smtputf8: bool) -> bool:
+    b = email.strip(_WHITESPACE).encode("utf-8")
+    if b.count(b"@") != 1:
+        return False
+    at = b.find(b"@")
+    local, domain = b[:at], b[at + 1:]
+    if not 0 < len(local) <= 64 or not _is_valid_local(local, allow_smtputf8):
+        return False
+    if not 0 < len(domain) <= 253 or b"." not in domain:
+        return False
+    if domain.isascii():
+        return _is_valid_labels(domain.split(b"."))
+    if all(not label or label.isdigit() for label in domain.split(b".")):
+        return False
+    return _is_valid_idn(domain.decode("utf-8"))
+
+
+def _has_one_inner_at(b: bytes) -> bool:
+    # Exactly one '@', not at either end, with a dot somewhere after it
+    at = b.find(b"@")
+    return 0 < at < len(b) - 1 and b.count(b"@") == 1 and b"." in b[at + 1:]
+
+
+def _is_valid_utf8(b: bytes, allow_smtputf8: bool) -> bool:
+    # Mirrors is_valid_fast: the ASCII fast paths only check the '@' and
+    # the dot; input with non-ASCII bytes gets the detailed checks
+    n = len(b)
+    tail = n - n % 8
+    if n >= 32 and b[:tail].isascii() and all(0x20 <= c < 0x80 for c in b[tail:]):
+        return _has_one_inner_at(b)
+    if not 3 <= n <= 254:
+        return False
+    if b.isascii():
+        return _has_one_inner_at(b)
+    if b.count(b"@") != 1:
+        return False
+    at = b.find(b"@")
+    if not 0 < at <= 64 or not 3 <= n - at - 1 <= 253 or b"." not in b[at + 1:]:
+        return False
+    return _is_valid_detailed(b.decode("utf-8"), allow_smtputf8)
+
+
+def _utf8(email: Union[str, bytes]) -> Optional[bytes]:
+    """UTF-8 form of email; None for bytes that are not valid UTF-8."""
+    if isinstance(email, bytes):
+        try:
+            email.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        return email
+    return email.encode("utf-8")
+
+
+def is_valid(email: Union[str, bytes], *, allow_smtputf8: bool = True) -> bool:
+    """Check if email is valid (returns bool, no exception)."""
+    b = _utf8(email)
+    return b is not None and _is_valid_utf8(b, allow_smtputf8)
+
+
+def is_valid_ultra(email: Union[str, bytes]) -> bool:
+    """ASCII-only check; returns False for non-ASCII input."""
+    b = _utf8(email)
+    return b is not None and 3 <= len(b) <= 254 and _ULTRA.fullmatch(b) is not None
+
+
+def batch_is_valid(emails: List[str], *, allow_smtputf8: bool = True) -> List[bool]:
+    """Batch validate multiple emails."""
+    return [is_valid(e, allow_smtputf8=allow_smtputf8) for e in emails]
+
+
+def batch_is_valid_packed(emails: List[str], *, allow_smtputf8: bool = True) -> bytes:
+    """Batch validate multiple emails into a bit-packed mask (LSB-first)."""
+    bits = bytearray((len(emails) + 7) // 8)
+    for i, e in enumerate(emails):
+        if is_valid(e, allow_smtputf8=allow_smtputf8):
+            bits[i >> 3] |= 1 << (i & 7)
+    return bytes(bits)
@@ -1,21 +1,59 @@
+use pyo3::exceptions::PyIndexError;
+use pyo3::ffi;
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyBytes, PyList, PyString};
+use pyval_core::batch::{StrColumn, ValidatedBatch as RustValidatedBatch};
+use pyval_core::cache::BoundedCache;
 use pyval_core::domain;
 use pyval_core::fastpath;
 use pyval_core::lazy::ZeroCopyValidator;
 use pyval_core::lookup;
 use pyval_core::simd::PortableSimd;
-use pyval_core::{EmailValidator as RustEmailValidator, ValidatedEmail as RustValidatedEmail};
+use pyval_core::validator::ValidateFn;
+use pyval_core::{
+    EmailError, EmailValidator as RustEmailValidator, ValidatedEmail as RustValidatedEmail,
+};
+
+/// Cached Python strings for recently seen domains
+///
+/// Most results share a handful of domains, so reusing one string object
+/// per domain saves an allocation per call and gives callers identical
+/// objects for their own dict lookups. The strings are deliberately not
+/// interned: interned strings are immortal on CPython 3.12+, so clearing
+/// the cache would free nothing.
+static DOMAIN_STRINGS: BoundedCache<Py<PyString>> = BoundedCache::new(1024);
+
+fn domain_string(py: Python<'_>, domain: &str) -> Py<PyString> {
+    if let Some(s) = DOMAIN_STRINGS.get_with(domain, |s| s.clone_ref(py)) {
+        return s;
+    }
+    let s = PyString::new(py, domain).unbind();
+    DOMAIN_STRINGS.insert(domain, s.clone_ref(py));
+    s
+}
+
+/// Borrow an address passed as `str` or `bytes`
+///
+/// `bytes` are read in place, skipping the str -> UTF-8 conversion CPython
+/// does for `str` arguments. `None` means the bytes are not UTF-8, which no
+/// valid address is.
+fn email_text<'a>(email: &'a Bound<'_, PyAny>) -> PyResult<Option<&'a str>> {
+    match email.downcast::<PyBytes>() {
+        Ok(bytes) => Ok(std::str::from_utf8(bytes.as_bytes()).ok()),
+        Err(_) => email.extract().map(Some),
+    }
+}
 
 /// Validated email result
-#[pyclass]
-#[derive(Clone)]
+#[pyclass(frozen)]
 struct ValidatedEmail {
     #[pyo3(get)]
     original: String,
     #[pyo3(get)]
     local_part: String,
     #[pyo3(get)]
-    domain: String,
+    domain: Py<PyString>,
     #[pyo3(get)]
     normalized: String,
     #[pyo3(get)]
@@ -24,12 +62,12 @@ struct ValidatedEmail {
     smtputf8: bool,
 }
 
-impl From<RustValidatedEmail> for ValidatedEmail {
-    fn from(v: RustValidatedEmail) -> Self {
+impl ValidatedEmail {
+    fn from_core(py: Python<'_>, v: RustValidatedEmail) -> Self {
         Self {
+            domain: domain_string(py, &v.domain),
             original: v.original,
             local_part: v.local_part,
-            domain: v.domain,
             normalized: v.normalized,
             ascii_domain: v.ascii_domain,
             smtputf8: v.smtputf8,
@@ -48,11 +86,230 @@ impl ValidatedEmail {
     }
 }
 
+/// Result of `validate_email_view`
+///
+/// When the input needed no normalization the view keeps the caller's
+/// string instead of copying it: `original` and `normalized` are that same
+/// object, `domain` and `ascii_domain` the cached domain string, and
+/// `local_part` is cut out of it on access.
+#[pyclass(frozen)]
+struct ValidatedEmailView {
+    parts: ViewParts,
+}
+
+enum ViewParts {
+    Shared {
+        email: Py<PyString>,
+        domain: Py<PyString>,
+        // Index of the '@' in characters, not bytes
+        at: ffi::Py_ssize_t,
+        smtputf8: bool,
+    },
+    Owned(ValidatedEmail),
+}
+
+#[pymethods]
+impl ValidatedEmailView {
+    #[getter]
+    fn original<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        match &self.parts {
+            ViewParts::Shared { email, .. } => email.bind(py).clone(),
+            ViewParts::Owned(v) => PyString::new(py, &v.original),
+        }
+    }
+
+    #[getter]
+    fn local_part<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyString>> {
+        match &self.parts {
+            ViewParts::Shared { email, at, .. } => unsafe {
+                // SAFETY: `email` is a str and `at` lies within it; the call
+                // returns a new reference, or NULL with an exception set
+                let part = ffi::PyUnicode_Substring(email.as_ptr(), 0, *at);
+                Ok(Bound::from_owned_ptr_or_err(py, part)?.downcast_into_unchecked())
+            },
+            ViewParts::Owned(v) => Ok(PyString::new(py, &v.local_part)),
+        }
+    }
+
+    #[getter]
+    fn domain<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        match &self.parts {
+            ViewParts::Shared { domain, .. } => domain.bind(py).clone(),
+            ViewParts::Owned(v) => v.domain.bind(py).clone(),
+        }
+    }
+
+    #[getter]
+    fn normalized<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        match &self.parts {
+            ViewParts::Shared { email, .. } => email.bind(py).clone(),
+            ViewParts::Owned(v) => PyString::new(py, &v.normalized),
+        }
+    }
+
+    #[getter]
+    fn ascii_domain<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        match &self.parts {
+            ViewParts::Shared { domain, .. } => domain.bind(py).clone(),
+            ViewParts::Owned(v) => PyString::new(py, &v.ascii_domain),
+        }
+    }
+
+    #[getter]
+    fn smtputf8(&self) -> bool {
+        match &self.parts {
+            ViewParts::Shared { smtputf8, .. } => *smtputf8,
+            ViewParts::Owned(v) => v.smtputf8,
+        }
+    }
+
+    fn __repr__(&self, py: Python<'_>) -> String {
+        format!("ValidatedEmailView('{}')", self.normalized(py))
+    }
+
+    fn __str__<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        self.normalized(py)
+    }
+}
+
+/// Columnar results of `batch_validate`
+///
+/// Each attribute is one list over the whole batch, holding `None` for
+/// invalid addresses. A column's list is built on first access and the
+/// same list is returned afterwards. Indexing builds a `ValidatedEmail`
+/// (or `None`) on demand.
+#[pyclass(frozen)]
+struct ValidatedBatch {
+    inner: RustValidatedBatch,
+    lists: ColumnLists,
+}
+
+/// Python lists for the columns read so far
+#[derive(Default)]
+struct ColumnLists {
+    valid: GILOnceCell<Py<PyList>>,
+    original: GILOnceCell<Py<PyList>>,
+    local_part: GILOnceCell<Py<PyList>>,
+    domain: GILOnceCell<Py<PyList>>,
+    normalized: GILOnceCell<Py<PyList>>,
+    ascii_domain: GILOnceCell<Py<PyList>>,
+    smtputf8: GILOnceCell<Py<PyList>>,
+}
+
+/// The list in `cell`, built with `build` on first use
+fn cached_list<'py>(
+    py: Python<'py>,
+    cell: &GILOnceCell<Py<PyList>>,
+    build: impl FnOnce() -> PyResult<Bound<'py, PyList>>,
+) -> PyResult<Bound<'py, PyList>> {
+    cell.get_or_try_init(py, || build().map(Bound::unbind))
+        .map(|list| list.bind(py).clone())
+}
+
+impl ValidatedBatch {
+    fn new(inner: RustValidatedBatch) -> Self {
+        Self {
+            inner,
+            lists: ColumnLists::default(),
+        }
+    }
+
+    fn column<'py>(
+        &self,
+        py: Python<'py>,
+        cell: &GILOnceCell<Py<PyList>>,
+        column: &StrColumn,
+    ) -> PyResult<Bound<'py, PyList>> {
+        cached_list(py, cell, || {
+            let rows = self.inner.valid.iter().zip(column.iter());
+            PyList::new(py, rows.map(|(&valid, s)| valid.then_some(s)))
+        })
+    }
+}
+
+#[pymethods]
+impl ValidatedBatch {
+    #[getter]
+    fn valid<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        cached_list(py, &self.lists.valid, || PyList::new(py, &self.inner.valid))
+    }
+
+    #[getter]
+    fn original<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        self.column(py, &self.lists.original, &self.inner.original)
+    }
+
+    #[getter]
+    fn local_part<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        self.column(py, &self.lists.local_part, &self.inner.local_part)
+    }
+
+    #[getter]
+    fn domain<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        cached_list(py, &self.lists.domain, || {
+            let rows = self.inner.valid.iter().zip(self.inner.domain.iter());
+            PyList::new(
+                py,
+                rows.map(|(&valid, s)| valid.then(|| domain_string(py, s))),
+            )
+        })
+    }
+
+    #[getter]
+    fn normalized<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        self.column(py, &self.lists.normalized, &self.inner.normalized)
+    }
+
+    #[getter]
+    fn ascii_domain<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        self.column(py, &self.lists.ascii_domain, &self.inner.ascii_domain)
+    }
+
+    #[getter]
+    fn smtputf8<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        cached_list(py, &self.lists.smtputf8, || {
+            let rows = self.inner.valid.iter().zip(&self.inner.smtputf8);
+            PyList::new(
+                py,
+                rows.map(|(&valid, &smtputf8)| valid.then_some(smtputf8)),
+            )
+        })
+    }
+
+    fn __len__(&self) -> usize {
+        self.inner.len()
+    }
+
+    fn __getitem__(&self, py: Python<'_>, index: isize) -> PyResult<Option<ValidatedEmail>> {
+        let len = self.inner.len() as isize;
+        let i = if index < 0 { index + len } else { index };
+        if !(0..len).contains(&i) {
+            return Err(PyIndexError::new_err("ValidatedBatch index out of range"));
+        }
+        Ok(self
+            .inner
+            .get(i as usize)
+            .map(|v| ValidatedEmail::from_core(py, v)))
+    }
+
+    fn __repr__(&self) -> String {
+        let valid = self.inner.valid.iter().filter(|&&v| v).count();
+        format!(
+            "ValidatedBatch({} emails, {} valid)",
+            self.inner.len(),
+            valid
+        )
+    }
+}
+
 /// Email validator with configurable options
+///
+/// The options are resolved once, at construction, into a validation
+/// routine specialized for them, so per-call work has no option checks.
 #[pyclass]
 #[derive(Clone)]
 struct EmailValidator {
-    inner: RustEmailValidator,
+    validate: ValidateFn,
 }
 
 #[pymethods]
@@ -70,32 +327,40 @@ impl EmailValidator {
         allow_domain_literal: bool,
         check_deliverability: bool,
     ) -> Self {
+        let inner = RustEmailValidator {
+            allow_smtputf8,
+            allow_quoted_local,
+            allow_domain_literal,
+            check_deliverability,
+        };
         Self {
-            inner: RustEmailValidator {
-                allow_smtputf8,
-                allow_quoted_local,
-                allow_domain_literal,
-                check_deliverability,
-            },
+            validate: inner.specialized(),
         }
     }
 
-    fn validate_email(&self, email: &str) -> PyResult<ValidatedEmail> {
-        self.inner
-            .validate(email)
-            .map(ValidatedEmail::from)
+    fn validate_email(&self, py: Python<'_>, email: &Bound<'_, PyAny>) -> PyResult<ValidatedEmail> {
+        let email = email_text(email)?.ok_or(EmailError::InvalidCharacter)?;
+        (self.validate)(email)
+            .map(|v| ValidatedEmail::from_core(py, v))
             .map_err(|e| e.into())
     }
+
+    /// `validator(email)` is `validator.validate_email(email)`
+    fn __call__(&self, py: Python<'_>, email: &Bound<'_, PyAny>) -> PyResult<ValidatedEmail> {
+        self.validate_email(py, email)
+    }
 }
 
 /// Validate an email address (convenience function)
 #[pyfunction]
 #[pyo3(signature = (email, *, check_deliverability = false, allow_smtputf8 = true))]
 fn validate_email(
-    email: &str,
+    py: Python<'_>,
+    email: &Bound<'_, PyAny>,
     check_deliverability: bool,
     allow_smtputf8: bool,
 ) -> PyResult<ValidatedEmail> {
+    let email = email_text(email)?.ok_or(EmailError::InvalidCharacter)?;
     let validator = RustEmailValidator {
         allow_smtputf8,
         check_deliverability,
@@ -103,10 +368,46 @@ fn validate_email(
     };
     validator
         .validate(email)
-        .map(ValidatedEmail::from)
+        .map(|v| ValidatedEmail::from_core(py, v))
         .map_err(|e| e.into())
 }
 
+/// Validate an email address without copying an already-normalized input
+///
+/// Accepts and rejects exactly what `validate_email` does, `str` or
+/// `bytes`. Only a `str` can be shared; `bytes` input is always copied.
+#[pyfunction]
+#[pyo3(signature = (email, *, check_deliverability = false, allow_smtputf8 = true))]
+fn validate_email_view(
+    py: Python<'_>,
+    email: &Bound<'_, PyAny>,
+    check_deliverability: bool,
+    allow_smtputf8: bool,
+) -> PyResult<ValidatedEmailView> {
+    let text = email_text(email)?.ok_or(EmailError::InvalidCharacter)?;
+    let validator = RustEmailValidator {
+        allow_smtputf8,
+        check_deliverability,
+        ..Default::default()
+    };
+    let v = validator.validate(text)?;
+    let shared = email
+        .downcast_exact::<PyString>()
+        .ok()
+        .filter(|_| v.normalized == text && v.ascii_domain == v.domain);
+    let parts = if let Some(email) = shared {
+        ViewParts::Shared {
+            email: email.clone().unbind(),
+            domain: domain_string(py, &v.domain),
+            at: v.local_part.chars().count() as ffi::Py_ssize_t,
+            smtputf8: v.smtputf8,
+        }
+    } else {
+        ViewParts::Owned(ValidatedEmail::from_core(py, v))
+    };
+    Ok(ValidatedEmailView { parts })
+}
+
 /// Ultra-fast check using lookup tables and SIMD
 #[inline(always)]
 pub fn is_valid_fast(email: &str, allow_smtputf8: bool) -> bool {
@@ -223,37 +524,90 @@ pub fn is_valid_detailed(email: &str, allow_smtputf8: bool) -> bool {
 #[pyfunction]
 #[pyo3(signature = (email, *, allow_smtputf8 = true))]
 #[inline(always)]
-fn is_valid(email: &str, allow_smtputf8: bool) -> bool {
-    is_valid_fast(email, allow_smtputf8)
+fn is_valid(email: &Bound<'_, PyAny>, allow_smtputf8: bool) -> PyResult<bool> {
+    Ok(email_text(email)?.is_some_and(|e| is_valid_fast(e, allow_smtputf8)))
 }
 
 /// Ultra-fast is_valid using zero-copy validation
 #[pyfunction]
 #[pyo3(signature = (email, *))]
 #[inline(always)]
-fn is_valid_ultra(email: &str) -> bool {
-    ZeroCopyValidator::validate_no_alloc(email)
+fn is_valid_ultra(email: &Bound<'_, PyAny>) -> PyResult<bool> {
+    Ok(email_text(email)?.is_some_and(ZeroCopyValidator::validate_no_alloc))
+}
+
+/// Per-email is_valid results for a batch
+fn batch_validity(emails: &[String], allow_smtputf8: bool) -> impl Iterator<Item = bool> + '_ {
+    emails.iter().map(move |e| is_valid_fast(e, allow_smtputf8))
 }
 
 /// Batch validate multiple emails (for high throughput)
 #[pyfunction]
 #[pyo3(signature = (emails, *, allow_smtputf8 = true))]
-fn batch_is_valid(emails: Vec<String>, allow_smtputf8: bool) -> Vec<bool> {
-    emails
-        .iter()
-        .map(|e| is_valid_fast(e, allow_smtputf8))
-        .collect()
+fn batch_is_valid(py: Python<'_>, emails: Vec<String>, allow_smtputf8: bool) -> Vec<bool> {
+    // Arguments are already copied out of Python objects, so the loop runs without the GIL
+    py.allow_threads(|| batch_validity(&emails, allow_smtputf8).collect())
+}
+
+/// Batch validate multiple emails into a bit-packed mask
+///
+/// Bit `i % 8` of byte `i / 8` is set when `emails[i]` is valid, so no
+/// Python bool is created per email.
+#[pyfunction]
+#[pyo3(signature = (emails, *, allow_smtputf8 = true))]
+fn batch_is_valid_packed<'py>(
+    py: Python<'py>,
+    emails: Vec<String>,
+    allow_smtputf8: bool,
+) -> Bound<'py, PyBytes> {
+    let bits = py.allow_threads(|| {
+        let mut bits = vec![0u8; emails.len().div_ceil(8)];
+        for (i, valid) in batch_validity(&emails, allow_smtputf8).enumerate() {
+            if valid {
+                bits[i / 8] |= 1 << (i % 8);
+            }
+        }
+        bits
+    });
+    PyBytes::new(py, &bits)
+}
+
+/// Validate multiple emails into columnar results
+///
+/// Validation runs without the GIL; the result keeps each field as one
+/// contiguous column rather than one object per email.
+#[pyfunction]
+#[pyo3(signature = (emails, *, check_deliverability = false, allow_smtputf8 = true))]
+fn batch_validate(
+    py: Python<'_>,
+    emails: Vec<String>,
+    check_deliverability: bool,
+    allow_smtputf8: bool,
+) -> ValidatedBatch {
+    let validate = RustEmailValidator {
+        allow_smtputf8,
+        check_deliverability,
+        ..Default::default()
+    }
+    .specialized();
+    let inner = py.allow_threads(|| RustValidatedBatch::validate(&emails, validate));
+    ValidatedBatch::new(inner)
 }
 
 /// pyval module
 #[pymodule]
 fn emailval(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<ValidatedEmail>()?;
+    m.add_class::<ValidatedEmailView>()?;
+    m.add_class::<ValidatedBatch>()?;
     m.add_class::<EmailValidator>()?;
     m.add_function(wrap_pyfunction!(validate_email, m)?)?;
+    m.add_function(wrap_pyfunction!(validate_email_view, m)?)?;
     m.add_function(wrap_pyfunction!(is_valid, m)?)?;
     m.add_function(wrap_pyfunction!(is_valid_ultra, m)?)?;
     m.add_function(wrap_pyfunction!(batch_is_valid, m)?)?;
+    m.add_function(wrap_pyfunction!(batch_is_valid_packed, m)?)?;
+    m.add_function(wrap_pyfunction!(batch_validate, m)?)?;
     m.add("__version__", "0.2.0")?;
     Ok(())
 }
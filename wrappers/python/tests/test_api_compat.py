@@ -5,7 +5,8 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / 'test_data'))
 
-from emails import VALID_EMAILS, INVALID_EMAILS, EDGE_CASES
+from emails import VALID_EMAILS, INVALID_EMAILS, EDGE_CASES, VALID_EMAILS_B, INVALID_EMAILS_B
+from emails import generate_bulk_emails
 
 
 def get_implementations():
@@ -27,11 +28,11 @@ class TestValidEmails:
     def test_valid_emails_emailval(self, email):
         """emailval should accept all valid emails."""
         try:
-            import emailval
+            from emailval import validate_email
         except ImportError:
             pytest.skip("emailval not built")
         
-        result = emailval.validate_email(email, check_deliverability=False)
+        result = validate_email(email, check_deliverability=False)
         assert result is not None
         assert result.normalized
 
@@ -41,12 +42,12 @@ class TestInvalidEmails:
     def test_invalid_emails_emailval(self, email):
         """emailval should reject all invalid emails."""
         try:
-            import emailval
+            from emailval import validate_email
         except ImportError:
             pytest.skip("emailval not built")
         
         with pytest.raises(ValueError):
-            emailval.validate_email(email, check_deliverability=False)
+            validate_email(email, check_deliverability=False)
 
 
 class TestNormalization:
@@ -54,7 +55,7 @@ class TestNormalization:
         """Normalization should match python-email-validator."""
         from email_validator import validate_email as py_validate
         try:
-            import emailval
+            from emailval import validate_email
         except ImportError:
             pytest.skip("emailval not built")
         
@@ -66,9 +67,135 @@ class TestNormalization:
         
         for email in test_cases:
             py_result = py_validate(email, check_deliverability=False)
-            rust_result = emailval.validate_email(email, check_deliverability=False)
+            rust_result = validate_email(email, check_deliverability=False)
             assert py_result.normalized == rust_result.normalized, f"Mismatch for {email}"
 
+    def test_ascii_domain(self):
+        """ASCII domains are lowercased; IDN domains are Punycode-encoded."""
+        try:
+            from emailval import validate_email
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        assert validate_email("user@Mail.EXAMPLE.com").ascii_domain == "mail.example.com"
+        idn = validate_email("用户@例子.广告")
+        assert all(label.startswith("xn--") for label in idn.ascii_domain.split("."))
+        assert idn.smtputf8 is True
+
+
+class TestValidatedEmail:
+    def test_domain_string_is_shared(self):
+        """Results for the same domain should reuse one cached string."""
+        try:
+            from emailval import validate_email
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        first = validate_email("alice@example.com", check_deliverability=False)
+        second = validate_email("bob@example.com", check_deliverability=False)
+        assert first.domain == "example.com"
+        assert first.domain is second.domain
+
+    def test_attributes_are_read_only(self):
+        try:
+            from emailval import validate_email
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        result = validate_email("alice@example.com", check_deliverability=False)
+        with pytest.raises(AttributeError):
+            result.domain = "other.com"
+
+    def test_bytes_input(self):
+        """validate_email() should accept UTF-8 bytes and reject other bytes."""
+        try:
+            from emailval import validate_email
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        result = validate_email(b"User@Example.COM")
+        assert result.original == "User@Example.COM"
+        assert result.normalized == validate_email("User@Example.COM").normalized
+        with pytest.raises(ValueError):
+            validate_email(b"\xff@example.com")
+
+
+class TestValidatedEmailView:
+    @pytest.mark.parametrize("email", VALID_EMAILS + ["User.Name@Example.COM", " user@example.com "])
+    def test_matches_validate_email(self, email):
+        try:
+            from emailval import validate_email, validate_email_view
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        try:
+            expected = validate_email(email)
+        except ValueError:
+            with pytest.raises(ValueError):
+                validate_email_view(email)
+            return
+        view = validate_email_view(email)
+        for attr in ("original", "local_part", "domain", "normalized", "ascii_domain", "smtputf8"):
+            assert getattr(view, attr) == getattr(expected, attr)
+
+    def test_normalized_input_is_shared(self):
+        try:
+            from emailval import validate_email_view
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        email = "".join(["user", "@example.com"])
+        view = validate_email_view(email)
+        assert view.original is email
+        assert view.normalized is email
+        assert view.local_part == "user"
+
+    def test_str_subclass_is_copied(self):
+        try:
+            from emailval import validate_email_view
+        except ImportError:
+            pytest.skip("emailval not built")
+
+        class Address(str):
+            pass
+
+        view = validate_email_view(Address("user@example.com"))
+        assert type(view.original) is str
+        assert type(view.normalized) is str
+        assert view.normalized == "user@example.com"
+
+    def test_bytes_input(self):
+        try:
+            from emailval import validate_email_view
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        assert validate_email_view(b"user@example.com").normalized == "user@example.com"
+        with pytest.raises(ValueError):
+            validate_email_view(b"\xff@example.com")
+
+
+class TestEmailValidator:
+    def test_call_matches_validate_email(self):
+        try:
+            from emailval import EmailValidator
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        validator = EmailValidator(check_deliverability=False)
+        assert validator("User@Example.COM").normalized == \
+            validator.validate_email("User@Example.COM").normalized
+
+    def test_options_fixed_at_construction(self):
+        try:
+            from emailval import EmailValidator
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        assert EmailValidator(allow_smtputf8=True)("юзер@example.com").smtputf8
+        with pytest.raises(ValueError):
+            EmailValidator(allow_smtputf8=False)("юзер@example.com")
+
 
 class TestIsValid:
     def test_is_valid_function(self):
@@ -82,6 +209,163 @@ class TestIsValid:
         assert emailval.is_valid("invalid@@email") is False
         assert emailval.is_valid("") is False
 
+    def test_bytes_input(self):
+        """is_valid() and is_valid_ultra() should treat UTF-8 bytes like str."""
+        try:
+            import emailval
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        for email, email_b in zip(VALID_EMAILS + INVALID_EMAILS, VALID_EMAILS_B + INVALID_EMAILS_B):
+            assert emailval.is_valid(email_b) is emailval.is_valid(email)
+            assert emailval.is_valid_ultra(email_b) is emailval.is_valid_ultra(email)
+        assert emailval.is_valid(b"\xff@example.com") is False
+        assert emailval.is_valid_ultra(b"\xff@example.com") is False
+
+
+class TestBatchIsValid:
+    def test_matches_is_valid(self):
+        """batch_is_valid() should give is_valid()'s answer for every email."""
+        try:
+            import emailval
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        emails = (
+            VALID_EMAILS + INVALID_EMAILS + [e for e, _ in EDGE_CASES]
+            + ["a@1.2", "a@b-.com", "x" * 70 + "@example.com", "a@" + "b" * 70 + ".com"]
+            + generate_bulk_emails(2000)
+        )
+        for allow_smtputf8 in (True, False):
+            assert emailval.batch_is_valid(emails, allow_smtputf8=allow_smtputf8) == [
+                emailval.is_valid(e, allow_smtputf8=allow_smtputf8) for e in emails
+            ]
+
+
+class TestBatchIsValidPacked:
+    def test_packed_matches_batch_is_valid(self):
+        """batch_is_valid_packed() should hold batch_is_valid() as LSB-first bits."""
+        try:
+            import emailval
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        emails = VALID_EMAILS + INVALID_EMAILS
+        packed = emailval.batch_is_valid_packed(emails)
+        assert isinstance(packed, bytes)
+        assert len(packed) == (len(emails) + 7) // 8
+        unpacked = [bool(packed[i // 8] >> (i % 8) & 1) for i in range(len(emails))]
+        assert unpacked == emailval.batch_is_valid(emails)
+
+    def test_empty(self):
+        try:
+            import emailval
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        assert emailval.batch_is_valid_packed([]) == b""
+
+
+class TestBatchValidate:
+    def test_columns_match_validate_email(self):
+        """Each column should hold the matching validate_email() attribute."""
+        try:
+            from emailval import batch_validate, validate_email
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        emails = VALID_EMAILS + INVALID_EMAILS
+        batch = batch_validate(emails)
+        assert len(batch) == len(emails)
+        valid, normalized, domain = batch.valid, batch.normalized, batch.domain
+        for i, email in enumerate(emails):
+            try:
+                expected = validate_email(email)
+            except ValueError:
+                assert valid[i] is False
+                assert normalized[i] is None
+                assert batch[i] is None
+                continue
+            assert valid[i] is True
+            assert normalized[i] == expected.normalized
+            assert domain[i] == expected.domain
+            assert batch[i].local_part == expected.local_part
+
+    def test_columns_are_built_once(self):
+        """Repeated reads of a column should return the same list."""
+        try:
+            from emailval import batch_validate
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        batch = batch_validate(["a@example.com", "invalid"])
+        assert batch.normalized is batch.normalized
+        assert batch.valid is batch.valid
+
+    def test_index_out_of_range(self):
+        try:
+            from emailval import batch_validate
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        batch = batch_validate(["a@example.com"])
+        assert batch[-1].normalized == "a@example.com"
+        with pytest.raises(IndexError):
+            batch[1]
+        assert len(batch_validate([])) == 0
+
+
+class TestIsValidUltra:
+    @pytest.mark.parametrize("email", [
+        "",
+        "plainaddress",
+        "two@@ats.com",
+        ".leadingdot@example.com",
+        "a@example.com.",
+        " leadingspace@example.com",
+        "a(b)@example.com",
+        "email@example-.com",
+        "abcdefghijklmnopqrstuvwxyz 0123456789@example.com",
+    ])
+    def test_rejects_malformed(self, email):
+        """is_valid_ultra() should reject malformed input, whether the
+        vectorized pre-pass or the parser catches it."""
+        try:
+            import emailval
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        assert emailval.is_valid_ultra(email) is False
+
+    def test_accepts_long_ascii(self):
+        """Inputs spanning several SIMD blocks should still be accepted."""
+        try:
+            import emailval
+        except ImportError:
+            pytest.skip("emailval not built")
+        
+        assert emailval.is_valid_ultra("abcdefghijklmnopqrstuvwxyz0123456789@example.com") is True
+
+
+
+class TestFallback:
+    @pytest.mark.parametrize("allow_smtputf8", [True, False])
+    def test_matches_native(self, allow_smtputf8):
+        """The pure-Python fallback should give the native extension's answers."""
+        try:
+            from emailval import emailval as native
+        except ImportError:
+            pytest.skip("emailval not built")
+        from emailval import _fallback
+        
+        emails = VALID_EMAILS + INVALID_EMAILS + [" user@example.com ", "é@example..com"]
+        for email in emails:
+            assert _fallback.is_valid(email, allow_smtputf8=allow_smtputf8) is \
+                native.is_valid(email, allow_smtputf8=allow_smtputf8), email
+            assert _fallback.is_valid_ultra(email) is native.is_valid_ultra(email), email
+        assert _fallback.batch_is_valid(emails, allow_smtputf8=allow_smtputf8) == \
+            native.batch_is_valid(emails, allow_smtputf8=allow_smtputf8)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])